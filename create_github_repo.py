@@ -6,6 +6,7 @@ This script helps create a GitHub repository for feishu-tools.
 
 Usage:
     python create_github_repo.py --token YOUR_GITHUB_TOKEN
+    python create_github_repo.py --token TOKEN_A --token TOKEN_B
 
 Requirements:
     - PyPI: pip install requests
@@ -15,37 +16,219 @@ Requirements:
 import os
 import sys
 import io
+import json
+import time
+import hashlib
+import tempfile
 import argparse
-import requests
-import subprocess
+import itertools
 from pathlib import Path
+from types import MappingProxyType
 
 # Fix encoding for Windows
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+    else:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+# Shared session so repeated API calls reuse the same TLS connection.
+# Built lazily so --help and --setup-only never import requests.
+_SESSION = None
 
-def create_github_repo(token, repo_name="feishu-tools", private=False):
-    """Create GitHub repository via API"""
+TOKEN_HELP = """\
+============================================================
+GitHub Token Required
+============================================================
+
+To create a GitHub repository, you need a personal access token:
+
+1. Go to: https://github.com/settings/tokens
+2. Click 'Generate new token (classic)'
+3. Select 'repo' scope
+4. Generate and copy the token
+
+Then run:
+  python {prog} --token YOUR_TOKEN
+
+Or set environment variable:
+  export GITHUB_TOKEN=YOUR_TOKEN  # Linux/Mac
+  set GITHUB_TOKEN=YOUR_TOKEN     # Windows
+
+Multiple tokens (round-robin across rate limits):
+  export GITHUB_TOKENS=TOKEN_A,TOKEN_B
+
+============================================================
+
+Manual Creation Steps:
+------------------------------------------------------------
+1. Visit: https://github.com/new
+2. Repository name: feishu-tools
+3. Description: Feishu (Lark) integration skill for Claude Code
+4. Set as Public
+5. Click 'Create repository'
+6. Run this script with --setup-only to push existing code
+"""
+
+REST_REPOS_URL = "https://api.github.com/user/repos"
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+_CREATE_REPO_MUTATION = """
+mutation($input: CreateRepositoryInput!) {
+  createRepository(input: $input) {
+    repository { url sshUrl databaseId }
+  }
+}
+"""
+
+# Fixed fields of the repository creation payload
+_REPO_DEFAULTS = MappingProxyType({
+    "description": "Feishu (Lark) integration skill for Claude Code - Create, read, edit and manage documents with rich text formatting support",
+    "has_issues": True,
+    "has_projects": True,
+    "has_wiki": True,
+    "auto_init": False
+})
+
+# Error phrases GitHub uses when the repository name is taken
+ALREADY_EXISTS_KEYWORDS = ("already exists", "already_exists")
+
+# Round-robin iterators, one per distinct token pool
+_TOKEN_CYCLES = {}
+
+# Created repositories are remembered so re-runs can skip the API call
+CACHE_FILE = os.path.expanduser("~/.feishu_tools_gh_cache.json")
+CACHE_TTL = 24 * 3600
+
+
+def _cache_key(token, repo_name):
+    """Build cache key without storing the raw token"""
+    return hashlib.sha256(f"{token}\0{repo_name}".encode()).hexdigest()
+
+
+def _load_cache():
+    """Load repository cache from disk"""
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _save_cache(cache):
+    """Atomically write repository cache to disk"""
+    cache_dir = os.path.dirname(CACHE_FILE)
+    try:
+        # mkstemp already creates the file as 0600
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".feishu_tools_gh_cache.")
+    except Exception:
+        return
+
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, CACHE_FILE)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _get_session():
+    """Create the shared GitHub API session on first use"""
+    global _SESSION
+
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        _SESSION.headers.update({"Accept": "application/vnd.github.v3+json"})
+
+    return _SESSION
 
-    url = "https://api.github.com/user/repos"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
 
-    data = {
+def _next_token(tokens):
+    """Return the next token from a round-robin pool"""
+    key = tuple(tokens)
+    if key not in _TOKEN_CYCLES:
+        _TOKEN_CYCLES[key] = itertools.cycle(key)
+    return next(_TOKEN_CYCLES[key])
+
+
+def _post_github(url, tokens, payload):
+    """POST to the GitHub API, rotating past rate-limited tokens"""
+    for _ in range(len(tokens)):
+        headers = {"Authorization": f"token {_next_token(tokens)}"}
+        response = _get_session().post(url, headers=headers, json=payload, timeout=(5, 30))
+
+        if not (response.status_code == 403
+                and response.headers.get("X-RateLimit-Remaining") == "0"):
+            break
+
+    return response
+
+
+def _create_repo_graphql(tokens, repo_name, private):
+    """Create repository with a single GraphQL mutation
+
+    Returns None when GraphQL is not available so the caller can use REST.
+    """
+    variables = {"input": {
         "name": repo_name,
-        "description": "Feishu (Lark) integration skill for Claude Code - Create, read, edit and manage documents with rich text formatting support",
-        "private": private,
-        "has_issues": True,
-        "has_projects": True,
-        "has_wiki": True,
-        "auto_init": False
-    }
+        "description": _REPO_DEFAULTS["description"],
+        "visibility": "PRIVATE" if private else "PUBLIC",
+        "hasIssuesEnabled": _REPO_DEFAULTS["has_issues"],
+        "hasWikiEnabled": _REPO_DEFAULTS["has_wiki"]
+    }}
+    response = _post_github(GRAPHQL_URL, tokens, {"query": _CREATE_REPO_MUTATION, "variables": variables})
+
+    if response.status_code != 200:
+        return None
+
+    body = response.json()
+    repo = ((body.get("data") or {}).get("createRepository") or {}).get("repository")
+
+    if repo:
+        # Match the REST response fields used by callers
+        return True, {
+            "html_url": repo["url"],
+            "clone_url": f"{repo['url']}.git",
+            "ssh_url": repo["sshUrl"],
+            "id": repo["databaseId"]
+        }
 
-    response = requests.post(url, headers=headers, json=data)
+    errors = body.get("errors") or []
+    if not errors:
+        return None
+
+    return False, {"message": errors[0].get("message", "Unknown error"), "errors": errors}
+
+
+def create_github_repo(token, repo_name="feishu-tools", private=False):
+    """Create GitHub repository via API
+
+    token may be a single token or a list of tokens used round-robin.
+    """
+
+    tokens = [token] if isinstance(token, str) else list(token)
+
+    result = _create_repo_graphql(tokens, repo_name, private)
+    if result is not None:
+        return result
+
+    # Fall back to REST
+    data = {**_REPO_DEFAULTS, "name": repo_name, "private": private}
+    response = _post_github(REST_REPOS_URL, tokens, data)
 
     if response.status_code == 201:
         repo_data = response.json()
@@ -54,8 +237,67 @@ def create_github_repo(token, repo_name="feishu-tools", private=False):
         return False, response.json()
 
 
-def setup_git_remote(repo_url):
+def _push_with_pygit2(repo_url, token):
+    """Setup git remote and push in-process via libgit2"""
+    import pygit2
+
+    class _RejectingPushCallbacks(pygit2.RemoteCallbacks):
+        """Fail the push when the server rejects a ref (pygit2 ignores it by default)"""
+
+        def push_update_reference(self, refname, message):
+            if message is not None:
+                raise pygit2.GitError(f"push of {refname} rejected: {message}")
+
+    repo = pygit2.Repository(".")
+
+    # Push through an anonymous remote first so a failed push leaves no
+    # half-configured origin behind for the git CLI fallback
+    remote = repo.remotes.create_anonymous(repo_url) if repo_url else repo.remotes["origin"]
+    callbacks = _RejectingPushCallbacks(
+        credentials=pygit2.UserPass("x-access-token", token)
+    )
+    remote.push(["refs/heads/master"], callbacks=callbacks)
+
+    # Only reached once the server accepted the ref update
+    if repo_url and "origin" not in repo.remotes.names():
+        repo.remotes.create("origin", repo_url)
+
+    # Equivalent of `git push -u`
+    repo.config["branch.master.remote"] = "origin"
+    repo.config["branch.master.merge"] = "refs/heads/master"
+
+
+def _origin_exists():
+    """Check whether the current repository already has an origin remote"""
+    import subprocess
+
+    result = subprocess.run(
+        ["git", "remote", "get-url", "origin"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    return result.returncode == 0
+
+
+def setup_git_remote(repo_url, token=None):
     """Setup git remote and push"""
+    import subprocess
+
+    # Push without spawning git processes when pygit2 and a token are available.
+    # pygit2 is imported here so runs that never push don't pay for it.
+    pygit2 = None
+    if token:
+        try:
+            import pygit2
+        except ImportError:
+            pass
+
+    if pygit2 is not None:
+        try:
+            _push_with_pygit2(repo_url, token)
+            return True, "Successfully pushed to GitHub"
+        except (pygit2.GitError, KeyError, ValueError, AttributeError):
+            pass  # Fall back to the git CLI (older pygit2 lacks create_anonymous)
 
     try:
         # Add remote only if repo_url is provided
@@ -63,7 +305,8 @@ def setup_git_remote(repo_url):
             subprocess.run(
                 ["git", "remote", "add", "origin", repo_url],
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
             )
 
         # Push to GitHub
@@ -81,44 +324,19 @@ def main():
     parser = argparse.ArgumentParser(
         description="Create GitHub repository for feishu-tools"
     )
-    parser.add_argument("--token", help="GitHub personal access token")
+    parser.add_argument("--token", action="append", help="GitHub personal access token (repeatable)")
     parser.add_argument("--private", action="store_true", help="Create private repository")
     parser.add_argument("--setup-only", action="store_true", help="Only setup git remote (repo already exists)")
 
     args = parser.parse_args()
 
-    token = args.token or os.getenv("GITHUB_TOKEN")
+    tokens = args.token or [t.strip() for t in os.getenv("GITHUB_TOKENS", "").split(",") if t.strip()]
+    if not tokens and os.getenv("GITHUB_TOKEN"):
+        tokens = [os.getenv("GITHUB_TOKEN")]
+    token = tokens[0] if tokens else None
 
     if not token and not args.setup_only:
-        print("=" * 60)
-        print("GitHub Token Required")
-        print("=" * 60)
-        print()
-        print("To create a GitHub repository, you need a personal access token:")
-        print()
-        print("1. Go to: https://github.com/settings/tokens")
-        print("2. Click 'Generate new token (classic)'")
-        print("3. Select 'repo' scope")
-        print("4. Generate and copy the token")
-        print()
-        print("Then run:")
-        print(f"  python {sys.argv[0]} --token YOUR_TOKEN")
-        print()
-        print("Or set environment variable:")
-        print("  export GITHUB_TOKEN=YOUR_TOKEN  # Linux/Mac")
-        print("  set GITHUB_TOKEN=YOUR_TOKEN     # Windows")
-        print()
-        print("=" * 60)
-        print()
-        print("Manual Creation Steps:")
-        print("-" * 60)
-        print("1. Visit: https://github.com/new")
-        print("2. Repository name: feishu-tools")
-        print("3. Description: Feishu (Lark) integration skill for Claude Code")
-        print("4. Set as Public")
-        print("5. Click 'Create repository'")
-        print("6. Run this script with --setup-only to push existing code")
-        print()
+        print(TOKEN_HELP.format(prog=sys.argv[0]), file=sys.stderr)
         return 1
 
     if args.setup_only:
@@ -136,18 +354,48 @@ def main():
             print(f"✗ Error: {message}")
             return 1
 
+    # Reuse cached repository info if it is still fresh
+    cache = _load_cache()
+    key = _cache_key("\0".join(tokens), "feishu-tools")
+    cached = cache.get(key)
+
+    if cached and cached.get("exists") and cached.get("expires_at", 0) > time.time() + 600:
+        print(f"✓ Repository cached: {cached['html_url']}")
+        print()
+        print("Setting up git remote...")
+
+        # A previous run already added origin, so only push in that case
+        repo_url = None if _origin_exists() else cached['clone_url']
+        success, message = setup_git_remote(repo_url, token)
+        if success:
+            print(f"✓ {message}")
+            return 0
+
+        # Stale entry, drop it and fall back to the API
+        print(f"ℹ Cached repository unusable ({message}), retrying via API...")
+        cache.pop(key, None)
+        _save_cache(cache)
+
     # Create repository
     print(f"Creating GitHub repository: feishu-tools...")
-    success, result = create_github_repo(token, private=args.private)
+    success, result = create_github_repo(tokens, private=args.private)
 
     if success:
+        cache[key] = {
+            "exists": True,
+            "html_url": result['html_url'],
+            "clone_url": result['clone_url'],
+            "expires_at": time.time() + CACHE_TTL
+        }
+        _save_cache(cache)
+
         print(f"✓ Repository created: {result['html_url']}")
         print()
         print("Setting up git remote...")
 
         # Setup remote and push
         repo_url = result['clone_url']
-        success, message = setup_git_remote(repo_url)
+        success, message = setup_git_remote(repo_url, token)
 
         if success:
             print(f"✓ {message}")
@@ -172,11 +420,18 @@ def main():
             print(f"  git push -u origin master")
             return 1
     else:
+        if cache.pop(key, None) is not None:
+            _save_cache(cache)
+
         error_msg = result.get('message', 'Unknown error')
         errors = result.get('errors', [])
 
         # Check if repository already exists
-        if 'already exists' in error_msg.lower() or 'name already exists' in error_msg.lower() or (errors and any('already_exists' in str(e).lower() or 'name already exists' in str(e).lower() for e in errors)):
+        msg_l = error_msg.lower()
+        already = any(k in msg_l for k in ALREADY_EXISTS_KEYWORDS) or any(
+            any(k in str(e).lower() for k in ALREADY_EXISTS_KEYWORDS) for e in errors
+        )
+        if already:
             print("ℹ Repository already exists on GitHub")
             print()
             print("Attempting to push to existing repository...")
@@ -186,15 +441,9 @@ def main():
 
             # Check if remote exists
             try:
-                result = subprocess.run(
-                    ["git", "remote", "get-url", "origin"],
-                    capture_output=True,
-                    text=True
-                )
-
-                if result.returncode == 0:
+                if _origin_exists():
                     # Remote exists, just push
-                    success, message = setup_git_remote(None)
+                    success, message = setup_git_remote(None, token)
                     if success:
                         print(f"✓ {message}")
                         print()
@@ -214,7 +463,7 @@ def main():
                         return 1
                 else:
                     # Remote doesn't exist, add it
-                    success, message = setup_git_remote(repo_url)
+                    success, message = setup_git_remote(repo_url, token)
                     if success:
                         print(f"✓ {message}")
                         return 0
@@ -18,22 +18,41 @@ Usage:
 
 from typing import List, Dict, Any, Optional
 
+try:
+    from feishu_json import dumps_json
+except ImportError:  # imported as scripts.feishu_blocks
+    from .feishu_json import dumps_json
+
 
 class BlockFactory:
     """Factory for creating Feishu content blocks"""
 
-    # Available colors
-    COLORS = ["gray", "brown", "orange", "yellow", "green", "blue", "purple"]
+    __slots__ = ()
+
+    # Available colors (tuple keeps order for error messages)
+    _COLORS_TUPLE = ("gray", "brown", "orange", "yellow", "green", "blue", "purple")
+    COLORS = frozenset(_COLORS_TUPLE)
 
     # Supported code languages
-    CODE_LANGUAGES = [
+    _CODE_LANGUAGES_TUPLE = (
         "python", "javascript", "java", "c", "cpp", "go", "rust",
         "typescript", "php", "ruby", "swift", "kotlin", "scala",
         "csharp", "fsharp", "vb", "html", "css", "sql", "bash",
         "shell", "powershell", "json", "yaml", "xml", "markdown",
         "latex", "r", "matlab", "perl", "lua", "dart", "elixir",
         "haskell", "julia", "ocaml", "scheme", "clojure", "groovy"
-    ]
+    )
+    CODE_LANGUAGES = frozenset(_CODE_LANGUAGES_TUPLE)
+
+    @staticmethod
+    def dumps(blocks: Any) -> str:
+        """Serialize blocks to JSON (e.g. for batch creation requests)"""
+        return dumps_json(blocks)
+
+    @staticmethod
+    def _plain_text_element(content: str) -> Dict[str, Any]:
+        """Create an unstyled text run element"""
+        return {"text_run": {"content": content}}
 
     @staticmethod
     def _text_element(
@@ -47,8 +66,6 @@ class BlockFactory:
         background: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a text run element"""
-        element = {"text_run": {"content": content}}
-
         styles = {}
         if bold:
             styles["bold"] = True
@@ -62,17 +79,17 @@ class BlockFactory:
             styles["inline_code"] = True
         if text_color:
             if text_color not in BlockFactory.COLORS:
-                raise ValueError(f"Invalid color. Must be one of: {BlockFactory.COLORS}")
+                raise ValueError(f"Invalid color. Must be one of: {list(BlockFactory._COLORS_TUPLE)}")
             styles["text_color"] = text_color
         if background:
             if background not in BlockFactory.COLORS:
-                raise ValueError(f"Invalid color. Must be one of: {BlockFactory.COLORS}")
+                raise ValueError(f"Invalid color. Must be one of: {list(BlockFactory._COLORS_TUPLE)}")
             styles["background"] = background
 
         if styles:
-            element["text_run"]["text_element_style"] = styles
+            return {"text_run": {"content": content, "text_element_style": styles}}
 
-        return element
+        return {"text_run": {"content": content}}
 
     @staticmethod
     def text(
@@ -86,15 +103,19 @@ class BlockFactory:
         background: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a text block"""
+        if (bold or italic or underline or strikethrough or inline_code
+                or text_color or background):
+            element = BlockFactory._text_element(
+                content, bold, italic, underline,
+                strikethrough, inline_code, text_color, background
+            )
+        else:
+            element = BlockFactory._plain_text_element(content)
+
         return {
             "block_type": "text",
             "text": {
-                "elements": [
-                    BlockFactory._text_element(
-                        content, bold, italic, underline,
-                        strikethrough, inline_code, text_color, background
-                    )
-                ]
+                "elements": [element]
             }
         }
 
@@ -151,7 +172,8 @@ class BlockFactory:
             "block_type": "bullet",
             "bullet": {
                 "elements": [
-                    BlockFactory._text_element(content, **kwargs)
+                    BlockFactory._text_element(content, **kwargs) if kwargs
+                    else BlockFactory._plain_text_element(content)
                 ]
             }
         }
@@ -163,7 +185,8 @@ class BlockFactory:
             "block_type": "ordered",
             "ordered": {
                 "elements": [
-                    BlockFactory._text_element(content, **kwargs)
+                    BlockFactory._text_element(content, **kwargs) if kwargs
+                    else BlockFactory._plain_text_element(content)
                 ]
             }
         }
@@ -177,7 +200,7 @@ class BlockFactory:
         if language not in BlockFactory.CODE_LANGUAGES:
             raise ValueError(
                 f"Unsupported language: {language}. "
-                f"Must be one of: {', '.join(BlockFactory.CODE_LANGUAGES)}"
+                f"Must be one of: {', '.join(BlockFactory._CODE_LANGUAGES_TUPLE)}"
             )
 
         return {
@@ -185,41 +208,11 @@ class BlockFactory:
             "code": {
                 "language": language,
                 "elements": [
-                    {"text_run": {"content": content}}
+                    BlockFactory._plain_text_element(content)
                 ]
             }
         }
 
-    @staticmethod
-    def code_python(content: str) -> Dict[str, Any]:
-        """Create a Python code block"""
-        return BlockFactory.code(content, "python")
-
-    @staticmethod
-    def code_javascript(content: str) -> Dict[str, Any]:
-        """Create a JavaScript code block"""
-        return BlockFactory.code(content, "javascript")
-
-    @staticmethod
-    def code_bash(content: str) -> Dict[str, Any]:
-        """Create a Bash code block"""
-        return BlockFactory.code(content, "bash")
-
-    @staticmethod
-    def code_sql(content: str) -> Dict[str, Any]:
-        """Create a SQL code block"""
-        return BlockFactory.code(content, "sql")
-
-    @staticmethod
-    def code_json(content: str) -> Dict[str, Any]:
-        """Create a JSON code block"""
-        return BlockFactory.code(content, "json")
-
-    @staticmethod
-    def code_yaml(content: str) -> Dict[str, Any]:
-        """Create a YAML code block"""
-        return BlockFactory.code(content, "yaml")
-
     @staticmethod
     def image(image_token: str) -> Dict[str, Any]:
         """Create an image block"""
@@ -237,7 +230,7 @@ class BlockFactory:
             "block_type": "equation",
             "equation": {
                 "elements": [
-                    {"text_run": {"content": content}}
+                    BlockFactory._plain_text_element(content)
                 ]
             }
         }
@@ -264,7 +257,7 @@ class BlockFactory:
             "block_type": block_type,
             block_type: {
                 "elements": [
-                    BlockFactory._text_element(content)
+                    BlockFactory._plain_text_element(content)
                 ]
             }
         }
@@ -356,28 +349,60 @@ class BlockFactory:
         items: Dict[str, str]
     ) -> List[Dict[str, Any]]:
         """Create a definition list (bold terms, regular definitions)"""
-        blocks = []
-        for term, definition in items.items():
-            blocks.append(BlockFactory.text_multi([
+        return [
+            BlockFactory.text_multi([
                 BlockFactory._text_element(term + ": ", bold=True),
-                BlockFactory._text_element(definition)
-            ]))
-        return blocks
+                BlockFactory._plain_text_element(definition)
+            ])
+            for term, definition in items.items()
+        ]
 
     @staticmethod
     def metadata_table(
         metadata: Dict[str, str]
     ) -> List[Dict[str, Any]]:
         """Create a metadata table (key-value pairs)"""
-        blocks = [BlockFactory.heading3("Metadata")]
-
-        for key, value in metadata.items():
-            blocks.append(BlockFactory.text_multi([
+        rows = [
+            BlockFactory.text_multi([
                 BlockFactory._text_element(key + ": ", bold=True),
-                BlockFactory._text_element(str(value))
-            ]))
+                BlockFactory._plain_text_element(str(value))
+            ])
+            for key, value in metadata.items()
+        ]
+        return [BlockFactory.heading3("Metadata")] + rows
 
-        return blocks
+
+def _make_code_factory(language: str, label: str):
+    """Build a code block factory specialized for a fixed language"""
+    def factory(content: str) -> Dict[str, Any]:
+        # language is a trusted constant, so no CODE_LANGUAGES lookup
+        return {
+            "block_type": "code",
+            "code": {
+                "language": language,
+                "elements": [
+                    {"text_run": {"content": content}}
+                ]
+            }
+        }
+
+    factory.__name__ = f"code_{language}"
+    factory.__qualname__ = f"BlockFactory.code_{language}"
+    factory.__doc__ = f"Create a {label} code block"
+    return factory
+
+
+# BlockFactory.code_python, code_javascript, ...
+for _language, _label in (
+    ("python", "Python"),
+    ("javascript", "JavaScript"),
+    ("bash", "Bash"),
+    ("sql", "SQL"),
+    ("json", "JSON"),
+    ("yaml", "YAML"),
+):
+    setattr(BlockFactory, f"code_{_language}", staticmethod(_make_code_factory(_language, _label)))
+del _language, _label
 
 
 # Helper functions for common patterns
@@ -396,18 +421,14 @@ def create_markdown_like_document(
     Returns:
         List of blocks ready for batch creation
     """
-    factory = BlockFactory()
-    blocks = [factory.heading1(title)]
+    blocks = [BlockFactory.heading1(title)]
+    h_fns = (None, BlockFactory.heading1, BlockFactory.heading2, BlockFactory.heading3)
 
     for level, heading, content in sections:
-        if level == 1:
-            blocks.append(factory.heading1(heading))
-        elif level == 2:
-            blocks.append(factory.heading2(heading))
-        elif level == 3:
-            blocks.append(factory.heading3(heading))
+        if 1 <= level <= 3:
+            blocks.append(h_fns[level](heading))
         else:
-            blocks.append(factory.heading(heading, level))
+            blocks.append(BlockFactory.heading(heading, level))
 
         blocks.extend(content)
 
@@ -422,25 +443,24 @@ def create_api_endpoint_doc(
     example: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """Create documentation for an API endpoint"""
-    factory = BlockFactory()
     blocks = []
 
     # Method and path
-    blocks.append(factory.heading3(f"{method.upper()} {path}"))
+    blocks.append(BlockFactory.heading3(f"{method.upper()} {path}"))
 
     # Description
-    blocks.append(factory.text(description))
+    blocks.append(BlockFactory.text(description))
 
     # Parameters
     if parameters:
-        blocks.append(factory.heading4("Parameters"))
+        blocks.append(BlockFactory.heading("Parameters", 4))
         for param, desc in parameters.items():
-            blocks.append(factory.code(param + ": " + desc, "bash"))
+            blocks.append(BlockFactory.code(param + ": " + desc, "bash"))
 
     # Example
     if example:
-        blocks.append(factory.heading4("Example"))
-        blocks.append(factory.code(example, "bash"))
+        blocks.append(BlockFactory.heading("Example", 4))
+        blocks.append(BlockFactory.code(example, "bash"))
 
     return blocks
 
@@ -467,5 +487,4 @@ if __name__ == "__main__":
         factory.text("Yellow highlight", background="yellow"),
     ]
 
-    import json
-    print(json.dumps(blocks, indent=2))
+    print(factory.dumps(blocks))
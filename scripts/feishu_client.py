@@ -9,16 +9,54 @@ common API operations.
 Usage:
     python feishu_client.py create-document --title "My Document"
     python feishu_client.py get-blocks --doc-id "doxcnxxxxx"
+    python feishu_client.py get-blocks --doc-id "doxcnaaaaa" "doxcnbbbbb"
     python feishu_client.py search --query "keyword"
 """
 
 import os
 import sys
 import json
+import time
+import random
+import hashlib
 import argparse
+import tempfile
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Callable
+
+try:
+    from feishu_json import parse_json, write_json
+except ImportError:  # imported as scripts.feishu_client
+    from .feishu_json import parse_json, write_json
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    import httpx
+    import h2  # noqa: F401  (required by httpx for HTTP/2)
+except ImportError:
+    httpx = None
+
+# Tenant tokens are persisted here so short CLI runs can skip re-auth
+TOKEN_CACHE_DIR = os.path.expanduser("~/.cache/feishu")
+
+# Rate-limit error codes retried by FeishuClient._request with backoff
+RETRYABLE_CODES = {99991400, 1061045}
+MAX_ATTEMPTS = 5
+
+# Server errors retried by _request on idempotent requests (both HTTP stacks)
+RETRYABLE_STATUS = {500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+# Per-request timeout in seconds, for both HTTP stacks
+REQUEST_TIMEOUT = 30.0
 
 
 class FeishuClient:
@@ -28,8 +66,12 @@ class FeishuClient:
         self,
         app_id: Optional[str] = None,
         app_secret: Optional[str] = None,
-        base_url: str = "https://open.feishu.cn/open-apis"
+        base_url: str = "https://open.feishu.cn/open-apis",
+        http2: bool = False
     ):
+        """http2=True uses an httpx[http2] client instead of requests; its
+        network errors are then httpx.HTTPError, not requests.RequestException.
+        """
         self.app_id = app_id or os.getenv("FEISHU_APP_ID")
         self.app_secret = app_secret or os.getenv("FEISHU_APP_SECRET")
         self.base_url = base_url
@@ -42,19 +84,99 @@ class FeishuClient:
                 "as arguments or environment variables"
             )
 
-    def get_tenant_token(self) -> str:
+        if http2 and httpx is None:
+            raise ValueError("http2=True requires httpx with HTTP/2 support: pip install 'httpx[http2]'")
+
+        # Keep-alive session shared by all requests to the API host.
+        # With http2, concurrent requests are multiplexed over one HTTP/2
+        # connection instead of one connection each.
+        self._http2 = http2
+        if self._http2:
+            # No custom transport, so HTTP(S)_PROXY from the environment still applies
+            self._session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                timeout=REQUEST_TIMEOUT,
+                follow_redirects=True
+            )
+        else:
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                # Connection retries only; 429/5xx are left to the backoff in _request
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            ))
+        self._session.headers.update({"User-Agent": "feishu-tools/1.0"})
+
+    def _token_cache_path(self) -> str:
+        """Path of the on-disk token cache (app_id is hashed, not stored)"""
+        app_hash = hashlib.sha256(self.app_id.encode()).hexdigest()[:16]
+        return os.path.join(TOKEN_CACHE_DIR, f"token_{app_hash}.json")
+
+    def _load_cached_token(self) -> Optional[str]:
+        """Load a still-valid tenant token from disk"""
+        try:
+            with open(self._token_cache_path(), "r") as f:
+                cached = json.load(f)
+            expires_at = datetime.fromisoformat(cached["expires_at"])
+        except Exception:
+            return None
+
+        if expires_at <= datetime.now() + timedelta(seconds=60):
+            return None
+
+        self._token_expires_at = expires_at - timedelta(seconds=60)
+        return cached["token"]
+
+    def _save_cached_token(self, token: str, expires_at: datetime):
+        """Atomically persist the tenant token to disk (mode 0600)"""
+        try:
+            os.makedirs(TOKEN_CACHE_DIR, mode=0o700, exist_ok=True)
+            # mkstemp already creates the file as 0600
+            fd, tmp_path = tempfile.mkstemp(dir=TOKEN_CACHE_DIR, prefix=".token_")
+        except Exception:
+            return
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"token": token, "expires_at": expires_at.isoformat()}, f)
+            os.replace(tmp_path, self._token_cache_path())
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def get_tenant_token(self, force_refresh: bool = False) -> str:
         """Get or refresh tenant access token"""
-        if self._tenant_token and self._token_expires_at:
-            if datetime.now() < self._token_expires_at:
-                return self._tenant_token
+        if not force_refresh:
+            if self._tenant_token and self._token_expires_at:
+                if datetime.now() < self._token_expires_at:
+                    return self._tenant_token
+
+            cached = self._load_cached_token()
+            if cached:
+                self._tenant_token = cached
+                self._session.headers["Authorization"] = f"Bearer {cached}"
+                return cached
 
         # Fetch new token
         url = f"{self.base_url}/auth/v3/tenant_access_token/internal"
-        response = requests.post(
-            url,
-            json={"app_id": self.app_id, "app_secret": self.app_secret}
-        )
-        result = response.json()
+        payload = {"app_id": self.app_id, "app_secret": self.app_secret}
+        if self._http2:
+            # httpx can't drop a client header per request; build it without
+            request = self._session.build_request("POST", url, json=payload)
+            request.headers.pop("Authorization", None)
+            response = self._session.send(request)
+        else:
+            response = self._session.post(
+                url,
+                json=payload,
+                headers={"Authorization": None},  # Don't send the stale token
+                timeout=REQUEST_TIMEOUT
+            )
+        result = parse_json(response)
 
         if result.get("code") != 0:
             raise Exception(f"Failed to get token: {result.get('msg')}")
@@ -62,7 +184,10 @@ class FeishuClient:
         self._tenant_token = result["tenant_access_token"]
         # Set expiry 60 seconds before actual expiry
         expires_in = result.get("expire", 7200)
-        self._token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+        expires_at = datetime.now() + timedelta(seconds=expires_in)
+        self._token_expires_at = expires_at - timedelta(seconds=60)
+        self._session.headers["Authorization"] = f"Bearer {self._tenant_token}"
+        self._save_cached_token(self._tenant_token, expires_at)
 
         return self._tenant_token
 
@@ -70,27 +195,72 @@ class FeishuClient:
         self,
         method: str,
         endpoint: str,
+        build_body: Optional[Callable[[], Dict[str, Any]]] = None,
         **kwargs
     ) -> Dict[str, Any]:
-        """Make authenticated request to Feishu API"""
+        """Make authenticated request to Feishu API
+
+        build_body returns extra request kwargs and is called before every
+        attempt, for bodies such as file uploads that can only be sent once.
+        """
         url = f"{self.base_url}{endpoint}"
-        headers = kwargs.pop("headers", {})
-        headers["Authorization"] = f"Bearer {self.get_tenant_token()}"
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+
+        # Sets the session Authorization header when (re)fetched
+        self.get_tenant_token()
 
-        response = requests.request(method, url, headers=headers, **kwargs)
-        result = response.json()
+        token_refreshed = False
+        attempt = 0
+        while True:
+            if build_body is not None:
+                response = self._session.request(method, url, **kwargs, **build_body())
+            else:
+                response = self._session.request(method, url, **kwargs)
+            try:
+                result = parse_json(response)
+            except ValueError:
+                reason = response.reason_phrase if self._http2 else response.reason
+                result = {"code": response.status_code, "msg": reason}
+
+            # Handle token refresh (does not count as a rate-limit attempt)
+            if result.get("code") == 99991401 and not token_refreshed:
+                self.get_tenant_token(force_refresh=True)
+                token_refreshed = True
+                continue
+
+            # Back off on rate limiting and server errors, with jitter
+            retryable = (response.status_code == 429
+                         or result.get("code") in RETRYABLE_CODES
+                         or (response.status_code in RETRYABLE_STATUS
+                             and method.upper() in IDEMPOTENT_METHODS))
+            attempt += 1
+            if not retryable or attempt == MAX_ATTEMPTS:
+                break
 
-        # Handle token refresh
-        if result.get("code") == 99991401:
-            headers["Authorization"] = f"Bearer {self.get_tenant_token()}"
-            response = requests.request(method, url, headers=headers, **kwargs)
-            result = response.json()
+            time.sleep(min(60, 0.5 * 2 ** (attempt - 1)) + random.random() * 0.1)
 
         if result.get("code") != 0:
             raise Exception(f"API error {result.get('code')}: {result.get('msg')}")
 
         return result.get("data", {})
 
+    def _paginate(
+        self,
+        endpoint: str,
+        params: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield items from a paginated GET endpoint, one page at a time"""
+        params = dict(params)
+
+        while True:
+            result = self._request("GET", endpoint, params=params)
+            yield from result.get("items", [])
+
+            if "page_token" not in result:
+                break
+
+            params["page_token"] = result["page_token"]
+
     # Document Operations
 
     def create_document(
@@ -110,41 +280,29 @@ class FeishuClient:
         """Get document information"""
         return self._request("GET", f"/docx/v1/documents/{document_id}")
 
-    def get_document_blocks(
+    def iter_document_blocks(
         self,
         document_id: str,
         block_id: Optional[str] = None,
         page_size: int = 100
-    ) -> List[Dict[str, Any]]:
-        """Get all blocks from a document"""
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all blocks from a document without holding every page"""
         if block_id is None:
             block_id = document_id
 
-        all_blocks = []
-        page_token = ""
-
-        while True:
-            params = {
-                "document_revision_id": -1,
-                "page_size": page_size
-            }
-            if page_token:
-                params["page_token"] = page_token
-
-            result = self._request(
-                "GET",
-                f"/docx/v1/documents/{document_id}/blocks/{block_id}/children",
-                params=params
-            )
-
-            all_blocks.extend(result.get("items", []))
-
-            if "page_token" not in result:
-                break
-
-            page_token = result["page_token"]
+        return self._paginate(
+            f"/docx/v1/documents/{document_id}/blocks/{block_id}/children",
+            {"document_revision_id": -1, "page_size": page_size}
+        )
 
-        return all_blocks
+    def get_document_blocks(
+        self,
+        document_id: str,
+        block_id: Optional[str] = None,
+        page_size: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Get all blocks from a document"""
+        return list(self.iter_document_blocks(document_id, block_id, page_size))
 
     def search_documents(
         self,
@@ -199,6 +357,29 @@ class FeishuClient:
         )
         return [b["block_id"] for b in result["blocks"]]
 
+    def create_blocks(
+        self,
+        document_id: str,
+        parent_block_id: str,
+        blocks: List[Dict[str, Any]],
+        chunk_size: int = 50,
+        index: int = -1
+    ) -> List[str]:
+        """Create any number of blocks, batching up to chunk_size per request"""
+        block_ids = []
+
+        # Chunks are sent in order so appended blocks keep their sequence
+        for start in range(0, len(blocks), chunk_size):
+            chunk_index = index if index == -1 else index + start
+            block_ids.extend(self.batch_create_blocks(
+                document_id,
+                parent_block_id,
+                blocks[start:start + chunk_size],
+                chunk_index
+            ))
+
+        return block_ids
+
     def update_block(
         self,
         document_id: str,
@@ -223,25 +404,13 @@ class FeishuClient:
 
     # Wiki Operations
 
+    def iter_wiki_spaces(self, page_size: int = 50) -> Iterator[Dict[str, Any]]:
+        """Iterate over all Wiki spaces"""
+        return self._paginate("/wiki/v2/spaces", {"page_size": page_size})
+
     def get_wiki_spaces(self, page_size: int = 50) -> List[Dict[str, Any]]:
         """Get all Wiki spaces"""
-        all_spaces = []
-        page_token = ""
-
-        while True:
-            params = {"page_size": page_size}
-            if page_token:
-                params["page_token"] = page_token
-
-            result = self._request("GET", "/wiki/v2/spaces", params=params)
-            all_spaces.extend(result.get("items", []))
-
-            if "page_token" not in result:
-                break
-
-            page_token = result["page_token"]
-
-        return all_spaces
+        return list(self.iter_wiki_spaces(page_size))
 
     def create_wiki_node(
         self,
@@ -288,33 +457,24 @@ class FeishuClient:
         """Get root folder info"""
         return self._request("GET", "/drive/v1/root_folder/meta")
 
+    def iter_folder_children(
+        self,
+        folder_token: str,
+        page_size: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over folder children"""
+        return self._paginate(
+            f"/drive/v1/files/{folder_token}/children",
+            {"page_size": page_size}
+        )
+
     def get_folder_children(
         self,
         folder_token: str,
         page_size: int = 50
     ) -> List[Dict[str, Any]]:
         """Get folder children"""
-        all_items = []
-        page_token = ""
-
-        while True:
-            params = {"page_size": page_size}
-            if page_token:
-                params["page_token"] = page_token
-
-            result = self._request(
-                "GET",
-                f"/drive/v1/files/{folder_token}/children",
-                params=params
-            )
-            all_items.extend(result.get("items", []))
-
-            if "page_token" not in result:
-                break
-
-            page_token = result["page_token"]
-
-        return all_items
+        return list(self.iter_folder_children(folder_token, page_size))
 
     def create_folder(
         self,
@@ -342,15 +502,26 @@ class FeishuClient:
             file_name = os.path.basename(image_path)
 
         with open(image_path, "rb") as f:
-            files = {"file": (file_name, f, "image/png")}
-            data = {"file_type": "image", "file_name": file_name}
-
-            result = self._request(
-                "POST",
-                "/drive/v1/medias/upload_all",
-                files=files,
-                data=data
-            )
+            def build_body():
+                # Rewind so retries resend the whole file
+                f.seek(0)
+
+                # httpx already streams file uploads; requests needs MultipartEncoder
+                if MultipartEncoder is not None and not self._http2:
+                    # Stream the file from disk instead of buffering it in memory
+                    encoder = MultipartEncoder(fields={
+                        "file_type": "image",
+                        "file_name": file_name,
+                        "file": (file_name, f, "image/png")
+                    })
+                    return {"data": encoder, "headers": {"Content-Type": encoder.content_type}}
+
+                return {
+                    "files": {"file": (file_name, f, "image/png")},
+                    "data": {"file_type": "image", "file_name": file_name}
+                }
+
+            result = self._request("POST", "/drive/v1/medias/upload_all", build_body=build_body)
 
         return result["file_token"]
 
@@ -361,6 +532,7 @@ def main():
     parser = argparse.ArgumentParser(description="Feishu API Client")
     parser.add_argument("--app-id", help="Feishu App ID")
     parser.add_argument("--app-secret", help="Feishu App Secret")
+    parser.add_argument("--http2", action="store_true", help="Use HTTP/2 (requires httpx[http2])")
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -375,7 +547,7 @@ def main():
 
     # Get blocks
     get_blocks_parser = subparsers.add_parser("get-blocks", help="Get document blocks")
-    get_blocks_parser.add_argument("--doc-id", required=True, help="Document ID")
+    get_blocks_parser.add_argument("--doc-id", required=True, nargs="+", help="Document ID(s)")
 
     # Search
     search_parser = subparsers.add_parser("search", help="Search documents")
@@ -401,7 +573,7 @@ def main():
         return 1
 
     try:
-        client = FeishuClient(app_id=args.app_id, app_secret=args.app_secret)
+        client = FeishuClient(app_id=args.app_id, app_secret=args.app_secret, http2=args.http2)
 
         if args.command == "create-document":
             doc_id = client.create_document(args.title, args.folder)
@@ -409,11 +581,18 @@ def main():
 
         elif args.command == "get-info":
             info = client.get_document_info(args.doc_id)
-            print(json.dumps(info, indent=2))
+            write_json(info)
 
         elif args.command == "get-blocks":
-            blocks = client.get_document_blocks(args.doc_id)
-            print(json.dumps(blocks, indent=2))
+            if len(args.doc_id) == 1:
+                blocks = client.get_document_blocks(args.doc_id[0])
+            else:
+                # Fetch the token once up front, then share the session's pool
+                client.get_tenant_token()
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = executor.map(client.get_document_blocks, args.doc_id)
+                    blocks = dict(zip(args.doc_id, results))
+            write_json(blocks)
 
         elif args.command == "search":
             results = client.search_documents(args.query, args.type)
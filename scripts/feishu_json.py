@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Feishu JSON Helpers - Shared JSON encoding/decoding for the Feishu scripts
+
+Uses orjson when it is installed and falls back to the standard json module.
+Both paths produce the same output: 2-space indent, non-ASCII kept as UTF-8.
+
+Usage:
+    from feishu_json import parse_json, dumps_json, write_json
+"""
+
+import sys
+import json
+from typing import Dict, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(response) -> Dict[str, Any]:
+    """Parse a JSON response body (requests or httpx)"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize to indented JSON text"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def write_json(obj: Any):
+    """Write indented JSON plus a newline to stdout as raw UTF-8 bytes
+
+    Bypasses the text layer so CJK and emoji survive legacy console code pages.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = dumps_json(obj).encode("utf-8") + b"\n"
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
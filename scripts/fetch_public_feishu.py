@@ -18,10 +18,122 @@ import sys
 import json
 import argparse
 import re
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse, parse_qs
 
+try:
+    from feishu_json import parse_json, write_json
+except ImportError:  # imported as scripts.fetch_public_feishu
+    from .feishu_json import parse_json, write_json
+
+# Feishu / Lark Wiki and document URLs
+_URL_RE = re.compile(r'https://\w+\.(?:feishu\.cn|larksuite\.com)/(wiki|docx)/([^/?]+)')
+
+_PERMISSION_DENIED_MESSAGE = "This document requires authentication. Please configure credentials."
+
+_CONFIG_INSTRUCTIONS = """
+╔═══════════════════════════════════════════════════════════════╗
+║  🔐 This document requires authentication                      ║
+╚═══════════════════════════════════════════════════════════════╝
+
+To access private Feishu documents, you need to configure credentials:
+
+📋 Quick Setup:
+
+1. Create a Feishu app:
+   • Visit: https://open.feishu.cn/
+   • Create a "Self-built App"
+   • Copy App ID and App Secret
+
+2. Configure permissions:
+   • Go to "Permissions & Scopes"
+   • Add: docx:document (required)
+   • Add: wiki:wiki:readonly (optional, for Wiki)
+   • Add: drive:drive:readonly (optional, for Drive)
+
+3. Run setup script:
+   python scripts/setup_feishu_config.py
+
+4. Enter your App ID and App Secret when prompted
+
+📖 Detailed Guide:
+   See: references/APP_SETUP_GUIDE.md (bilingual English/中文)
+
+💡 Tip: For public documents, no setup is required!
+"""
+
+
+# (bold, italic) -> Markdown prefix/suffix
+_STYLE_WRAP = {
+    (False, False): ("", ""),
+    (True, False): ("**", "**"),
+    (False, True): ("*", "*"),
+    (True, True): ("***", "***"),
+}
+
+
+def _format_text(text: Dict[str, Any], output: List[str]):
+    """Append text runs, wrapping bold/italic in Markdown markers"""
+    for elem in text.get("elements", []):
+        text_run = elem.get("text_run", {})
+        content = text_run.get("content", "")
+        style = text_run.get("text_element_style", {})
+        pre, post = _STYLE_WRAP[(bool(style.get("bold")), bool(style.get("italic")))]
+        output.append(f"{pre}{content}{post}")
+
+
+def _format_heading(heading: Dict[str, Any], output: List[str]):
+    """Append heading runs as Markdown headings"""
+    prefix = "#" * heading.get("level", 1)
+    for elem in heading.get("elements", []):
+        content = elem.get("text_run", {}).get("content", "")
+        output.append(f"{prefix} {content}")
+
+
+def _format_code(code: Dict[str, Any], output: List[str]):
+    """Append code runs as fenced Markdown code blocks"""
+    lang = code.get("language", "")
+    for elem in code.get("elements", []):
+        content = elem.get("text_run", {}).get("content", "")
+        output.append(f"```{lang}\n{content}\n```")
+
+
+# Block payload key -> formatter used by FeishuPublicFetcher.format_output,
+# in priority order
+_BLOCK_FORMATTERS = {
+    "text": _format_text,
+    "heading": _format_heading,
+    "code": _format_code,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached() -> Optional[Dict[str, str]]:
+    """Load Feishu credentials from config file or environment"""
+    config_paths = [
+        os.path.expanduser("~/.claude/config.json"),
+        os.path.join(os.path.dirname(__file__), "../config.json")
+    ]
+
+    for config_path in config_paths:
+        if os.path.exists(config_path):
+            try:
+                with open(config_path, 'r') as f:
+                    config = json.load(f)
+                    return config.get("feishu", {})
+            except Exception:
+                pass
+
+    # Check environment variables
+    return {
+        "app_id": os.getenv("FEISHU_APP_ID"),
+        "app_secret": os.getenv("FEISHU_APP_SECRET")
+    }
+
 
 class FeishuPublicFetcher:
     """Fetch publicly accessible Feishu documents"""
@@ -29,22 +141,16 @@ class FeishuPublicFetcher:
     def __init__(self):
         self.base_url = "https://open.feishu.cn/open-apis"
 
+        # One keep-alive session for the public, token and document endpoints
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=10))
+
     def parse_url(self, url: str) -> Dict[str, str]:
         """Parse Feishu URL to extract document type and ID"""
-        # Support multiple URL formats
-        patterns = [
-            r'https://\w+\.feishu\.cn/wiki/([^/?]+)',  # Wiki URL
-            r'https://\w+\.feishu\.cn/docx/([^/?]+)',  # Document URL
-            r'https://\w+\.larksuite\.com/wiki/([^/?]+)',  # Lark Wiki
-            r'https://\w+\.larksuite\.com/docx/([^/?]+)',  # Lark Document
-        ]
-
-        for pattern in patterns:
-            match = re.match(pattern, url)
-            if match:
-                doc_id = match.group(1)
-                doc_type = "wiki" if "wiki" in url else "document"
-                return {"type": doc_type, "id": doc_id}
+        match = _URL_RE.match(url)
+        if match:
+            doc_type = "wiki" if match.group(1) == "wiki" else "document"
+            return {"type": doc_type, "id": match.group(2)}
 
         raise ValueError(f"Invalid Feishu URL format: {url}")
 
@@ -59,10 +165,10 @@ class FeishuPublicFetcher:
                 "language": "zh_cn"
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get("code") == 0:
                     return {
                         "success": True,
@@ -75,7 +181,7 @@ class FeishuPublicFetcher:
                     return {
                         "success": False,
                         "error": "permission_denied",
-                        "message": "This document requires authentication. Please configure credentials."
+                        "message": _PERMISSION_DENIED_MESSAGE
                     }
 
         except Exception as e:
@@ -98,10 +204,10 @@ class FeishuPublicFetcher:
                 "language": "zh_cn"
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get("code") == 0:
                     return {
                         "success": True,
@@ -114,7 +220,7 @@ class FeishuPublicFetcher:
                     return {
                         "success": False,
                         "error": "permission_denied",
-                        "message": "This document requires authentication. Please configure credentials."
+                        "message": _PERMISSION_DENIED_MESSAGE
                     }
 
         except Exception as e:
@@ -155,33 +261,17 @@ class FeishuPublicFetcher:
                 "message": f"Authentication failed: {str(e)}\n\n{self._get_config_instructions()}"
             }
 
-    def _load_config(self) -> Optional[Dict[str, str]]:
-        """Load Feishu credentials from config file"""
-        config_paths = [
-            os.path.expanduser("~/.claude/config.json"),
-            os.path.join(os.path.dirname(__file__), "../config.json")
-        ]
-
-        for config_path in config_paths:
-            if os.path.exists(config_path):
-                try:
-                    with open(config_path, 'r') as f:
-                        config = json.load(f)
-                        return config.get("feishu", {})
-                except Exception:
-                    pass
-
-        # Check environment variables
-        return {
-            "app_id": os.getenv("FEISHU_APP_ID"),
-            "app_secret": os.getenv("FEISHU_APP_SECRET")
-        }
+    def _load_config(self, reload: bool = False) -> Optional[Dict[str, str]]:
+        """Load Feishu credentials from config file (cached per process)"""
+        if reload:
+            _load_config_cached.cache_clear()
+        return _load_config_cached()
 
     def _get_tenant_token(self, app_id: str, app_secret: str) -> str:
         """Get tenant access token"""
         url = f"{self.base_url}/auth/v3/tenant_access_token/internal"
-        response = requests.post(url, json={"app_id": app_id, "app_secret": app_secret})
-        data = response.json()
+        response = self.session.post(url, json={"app_id": app_id, "app_secret": app_secret})
+        data = parse_json(response)
 
         if data.get("code") != 0:
             raise Exception(f"Failed to get token: {data.get('msg')}")
@@ -201,9 +291,19 @@ class FeishuPublicFetcher:
     def _fetch_document_with_token(self, document_id: str, token: str) -> Dict[str, Any]:
         """Fetch document with authentication"""
         url = f"{self.base_url}/docx/v1/documents/{document_id}"
+        blocks_url = f"{self.base_url}/docx/v1/documents/{document_id}/blocks/{document_id}/children"
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(url, headers=headers)
-        data = response.json()
+
+        # Metadata and blocks are independent, so fetch both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            doc_future = executor.submit(self.session.get, url, headers=headers)
+            blocks_future = executor.submit(
+                self.session.get, blocks_url, headers=headers, params={"page_size": 100}
+            )
+            doc_response = doc_future.result()
+            blocks_response = blocks_future.result()
+
+        data = parse_json(doc_response)
 
         if data.get("code") != 0:
             return {
@@ -212,10 +312,7 @@ class FeishuPublicFetcher:
                 "message": f"API error: {data.get('msg')}"
             }
 
-        # Get blocks
-        blocks_url = f"{self.base_url}/docx/v1/documents/{document_id}/blocks/{document_id}/children"
-        blocks_response = requests.get(blocks_url, headers=headers, params={"page_size": 100})
-        blocks_data = blocks_response.json()
+        blocks_data = parse_json(blocks_response)
 
         return {
             "success": True,
@@ -228,36 +325,7 @@ class FeishuPublicFetcher:
 
     def _get_config_instructions(self) -> str:
         """Get configuration instructions"""
-        return """
-╔═══════════════════════════════════════════════════════════════╗
-║  🔐 This document requires authentication                      ║
-╚═══════════════════════════════════════════════════════════════╝
-
-To access private Feishu documents, you need to configure credentials:
-
-📋 Quick Setup:
-
-1. Create a Feishu app:
-   • Visit: https://open.feishu.cn/
-   • Create a "Self-built App"
-   • Copy App ID and App Secret
-
-2. Configure permissions:
-   • Go to "Permissions & Scopes"
-   • Add: docx:document (required)
-   • Add: wiki:wiki:readonly (optional, for Wiki)
-   • Add: drive:drive:readonly (optional, for Drive)
-
-3. Run setup script:
-   python scripts/setup_feishu_config.py
-
-4. Enter your App ID and App Secret when prompted
-
-📖 Detailed Guide:
-   See: references/APP_SETUP_GUIDE.md (bilingual English/中文)
-
-💡 Tip: For public documents, no setup is required!
-"""
+        return _CONFIG_INSTRUCTIONS
 
     def format_output(self, result: Dict[str, Any]) -> str:
         """Format fetch result for display"""
@@ -288,34 +356,11 @@ To access private Feishu documents, you need to configure credentials:
                 block_type = block.get("block_type", "unknown")
                 output.append(f"\n[{block_type}]")
 
-                # Extract text content
-                if "text" in block:
-                    elements = block["text"].get("elements", [])
-                    for elem in elements:
-                        text_run = elem.get("text_run", {})
-                        content = text_run.get("content", "")
-                        style = text_run.get("text_element_style", {})
-                        if style.get("bold"):
-                            content = f"**{content}**"
-                        if style.get("italic"):
-                            content = f"*{content}*"
-                        output.append(content)
-
-                elif "heading" in block:
-                    level = block["heading"].get("level", 1)
-                    elements = block["heading"].get("elements", [])
-                    for elem in elements:
-                        content = elem.get("text_run", {}).get("content", "")
-                        output.append(f"{'#' * level} {content}")
-
-                elif "code" in block:
-                    lang = block["code"].get("language", "")
-                    elements = block["code"].get("elements", [])
-                    for elem in elements:
-                        content = elem.get("text_run", {}).get("content", "")
-                        output.append(f"```{lang}")
-                        output.append(content)
-                        output.append("```")
+                # Extract content; checked in text > heading > code priority
+                for key, formatter in _BLOCK_FORMATTERS.items():
+                    if key in block:
+                        formatter(block[key], output)
+                        break
 
         return "\n".join(output)
 
@@ -346,10 +391,11 @@ For private documents, the script will prompt you to configure credentials.
 
     args = parser.parse_args()
 
+    fetcher = FeishuPublicFetcher()
+
     # Determine document type and ID
     if args.url:
         try:
-            fetcher = FeishuPublicFetcher()
             parsed = fetcher.parse_url(args.url)
             doc_type = parsed["type"]
             doc_id = parsed["id"]
@@ -364,8 +410,6 @@ For private documents, the script will prompt you to configure credentials.
         return 1
 
     # Fetch document
-    fetcher = FeishuPublicFetcher()
-
     if doc_type == "wiki":
         result = fetcher.fetch_public_wiki(doc_id)
     else:
@@ -373,7 +417,7 @@ For private documents, the script will prompt you to configure credentials.
 
     # Output result
     if args.json:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        write_json(result)
     else:
         print(fetcher.format_output(result))
 
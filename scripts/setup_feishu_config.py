@@ -10,31 +10,132 @@ Usage:
 
 import os
 import sys
-import json
-import getpass
-import requests
-from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Single token POST, sent over a stdlib HTTPS connection (HTTPS_PROXY honored)
+_API_HOST = "open.feishu.cn"
+_TOKEN_PATH = "/open-apis/auth/v3/tenant_access_token/internal"
+
+_RUN_BANNER_TOP = """\
+╔═══════════════════════════════════════════════════════════════╗
+║        🚀 Feishu Skill - Credential Setup                    ║
+╚═══════════════════════════════════════════════════════════════╝
+
+This script will configure Feishu credentials for accessing
+private documents. Public documents don't require setup.
+
+📖 Setup Guide: references/APP_SETUP_GUIDE.md
+
+"""
+
+_RUN_BANNER_DONE = """
+╔═══════════════════════════════════════════════════════════════╗
+║  ✅ Setup complete! You can now access private documents.     ║
+╚═══════════════════════════════════════════════════════════════╝
+
+Next steps:
+  • Read documents: python scripts/feishu_client.py get-info --doc-id XXX
+  • Create documents: python scripts/feishu_client.py create-document --title 'My Doc'
+
+"""
+
+
+_HELP_TEXT = """
+╔═══════════════════════════════════════════════════════════════╗
+║  📚 Feishu App Setup - Quick Reference                        ║
+╚═══════════════════════════════════════════════════════════════╝
+
+1. Create a Feishu App:
+   • Visit: https://open.feishu.cn/
+   • Click "Create App" → "Self-built App"
+   • Enter app name (e.g., "Claude Feishu Reader")
+
+2. Get Credentials:
+   • Go to "Credentials & Basic Info"
+   • Copy App ID (format: cli_xxxxx)
+   • Copy App Secret (click "Show" to reveal)
+
+3. Configure Permissions:
+   • Go to "Permissions & Scopes"
+   • Click "Batch Import" → Select "JSON"
+   • Paste:
+   {
+     "scopes": {
+       "tenant": [
+         "docx:document",
+         "wiki:wiki:readonly",
+         "drive:drive:readonly"
+       ]
+     }
+   }
+   • Click "Import"
+
+4. Publish App (for testing):
+   • Go to "Debug Credentials"
+   • Your app is ready for testing!
+
+5. Run Setup:
+   • Run this script again
+   • Enter your App ID and App Secret
+
+📖 Full Guide: references/APP_SETUP_GUIDE.md (bilingual)
+
+💡 Tips:
+   • Use Debug Mode for personal use (no review needed)
+   • Public documents don't require any setup
+   • Keep your App Secret secure (like a password)
+
+
+"""
+
+
+def _open_api_connection():
+    """Open an HTTPS connection to the API host, tunnelling through HTTPS_PROXY if set"""
+    import http.client
+    import urllib.request
+    from urllib.parse import urlsplit, unquote
+
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(_API_HOST):
+        return http.client.HTTPSConnection(_API_HOST, 443, timeout=10)
+
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    parts = urlsplit(proxy)
+
+    # http.client can only CONNECT through a plaintext proxy; refuse others
+    # rather than speaking the wrong protocol to them
+    if parts.scheme != "http":
+        raise ValueError(
+            f"unsupported HTTPS_PROXY scheme '{parts.scheme}' (only http:// proxies are supported)"
+        )
+
+    headers = {}
+    if parts.username:
+        import base64
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode()
+
+    conn = http.client.HTTPSConnection(parts.hostname, parts.port or 80, timeout=10)
+    conn.set_tunnel(_API_HOST, 443, headers=headers)
+    return conn
 
 
 class FeishuConfigSetup:
     """Setup Feishu credentials"""
 
     def __init__(self):
-        self.config_dir = Path.home() / ".claude"
-        self.config_file = self.config_dir / "config.json"
-        self.base_url = "https://open.feishu.cn/open-apis"
+        self.config_dir = os.path.join(os.path.expanduser("~"), ".claude")
+        self.config_file = os.path.join(self.config_dir, "config.json")
 
     def run(self):
         """Run the setup process"""
-        print("╔═══════════════════════════════════════════════════════════════╗")
-        print("║        🚀 Feishu Skill - Credential Setup                    ║")
-        print("╚═══════════════════════════════════════════════════════════════╝")
-        print()
-        print("This script will configure Feishu credentials for accessing")
-        print("private documents. Public documents don't require setup.")
-        print()
-        print("📖 Setup Guide: references/APP_SETUP_GUIDE.md")
-        print()
+        sys.stdout.write(_RUN_BANNER_TOP)
+        sys.stdout.flush()
 
         # Get credentials
         app_id = self._get_input("Enter your Feishu App ID (cli_xxxxx): ")
@@ -64,15 +165,8 @@ class FeishuConfigSetup:
         self._save_config(app_id, app_secret, token)
 
         print("✅ Configuration saved to:", self.config_file)
-        print()
-        print("╔═══════════════════════════════════════════════════════════════╗")
-        print("║  ✅ Setup complete! You can now access private documents.     ║")
-        print("╚═══════════════════════════════════════════════════════════════╝")
-        print()
-        print("Next steps:")
-        print("  • Read documents: python scripts/feishu_client.py get-info --doc-id XXX")
-        print("  • Create documents: python scripts/feishu_client.py create-document --title 'My Doc'")
-        print()
+        sys.stdout.write(_RUN_BANNER_DONE)
+        sys.stdout.flush()
 
         return 0
 
@@ -85,6 +179,8 @@ class FeishuConfigSetup:
 
     def _get_secret(self, prompt: str) -> str:
         """Get secret input (hidden)"""
+        import getpass
+
         try:
             return getpass.getpass(prompt)
         except EOFError:
@@ -92,15 +188,26 @@ class FeishuConfigSetup:
 
     def _validate_credentials(self, app_id: str, app_secret: str) -> str:
         """Validate credentials and get tenant token"""
+        payload = {"app_id": app_id, "app_secret": app_secret}
+
         try:
-            url = f"{self.base_url}/auth/v3/tenant_access_token/internal"
-            response = requests.post(
-                url,
-                json={"app_id": app_id, "app_secret": app_secret},
-                timeout=10
-            )
+            if orjson is not None:
+                body = orjson.dumps(payload)
+            else:
+                import json
+                body = json.dumps(payload).encode("utf-8")
+
+            conn = _open_api_connection()
+            try:
+                conn.request("POST", _TOKEN_PATH, body, {"Content-Type": "application/json"})
+                raw = conn.getresponse().read()
+            finally:
+                conn.close()
 
-            data = response.json()
+            if orjson is not None:
+                data = orjson.loads(raw)
+            else:
+                data = json.loads(raw)
 
             if data.get("code") == 0:
                 return data.get("tenant_access_token")
@@ -114,15 +221,20 @@ class FeishuConfigSetup:
 
     def _save_config(self, app_id: str, app_secret: str, token: str):
         """Save configuration to file"""
+        import json
+        import tempfile
+
         # Create config directory if needed
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(self.config_dir, exist_ok=True)
 
         # Load existing config or create new
         config = {}
-        if self.config_file.exists():
+        if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                if data:
+                    config = orjson.loads(data) if orjson is not None else json.loads(data)
             except Exception:
                 pass
 
@@ -133,65 +245,27 @@ class FeishuConfigSetup:
             "tenant_access_token": token
         }
 
-        # Save config
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Save config atomically so a partial write can't corrupt it;
+        # mkstemp creates the file as 0600, so secrets are never world-readable
+        if orjson is not None:
+            payload = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            payload = (json.dumps(config, indent=2) + "\n").encode()
 
-        # Set restrictive permissions (Unix-like systems)
+        fd, tmp_path = tempfile.mkstemp(dir=self.config_dir, prefix=".config.")
         try:
-            os.chmod(self.config_file, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.config_file)
         except Exception:
-            pass
+            os.unlink(tmp_path)
+            raise
 
 
 def show_help():
     """Show help information"""
-    print("""
-╔═══════════════════════════════════════════════════════════════╗
-║  📚 Feishu App Setup - Quick Reference                        ║
-╚═══════════════════════════════════════════════════════════════╝
-
-1. Create a Feishu App:
-   • Visit: https://open.feishu.cn/
-   • Click "Create App" → "Self-built App"
-   • Enter app name (e.g., "Claude Feishu Reader")
-
-2. Get Credentials:
-   • Go to "Credentials & Basic Info"
-   • Copy App ID (format: cli_xxxxx)
-   • Copy App Secret (click "Show" to reveal)
-
-3. Configure Permissions:
-   • Go to "Permissions & Scopes"
-   • Click "Batch Import" → Select "JSON"
-   • Paste:
-   {
-     "scopes": {
-       "tenant": [
-         "docx:document",
-         "wiki:wiki:readonly",
-         "drive:drive:readonly"
-       ]
-     }
-   }
-   • Click "Import"
-
-4. Publish App (for testing):
-   • Go to "Debug Credentials"
-   • Your app is ready for testing!
-
-5. Run Setup:
-   • Run this script again
-   • Enter your App ID and App Secret
-
-📖 Full Guide: references/APP_SETUP_GUIDE.md (bilingual)
-
-💡 Tips:
-   • Use Debug Mode for personal use (no review needed)
-   • Public documents don't require any setup
-   • Keep your App Secret secure (like a password)
-
-""")
+    sys.stdout.write(_HELP_TEXT)
+    sys.stdout.flush()
 
 
 def main():